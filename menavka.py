@@ -2,18 +2,132 @@
 
 import itertools
 import math
+import os
 import random
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 from functools import lru_cache
-from time import sleep
 from typing import Generator
 
+import numpy as np  # numpy==1.26.4
 import pygame  # pygame==2.5.2
-from PIL import Image  # pillow==10.3.0
+
+try:
+    from numba import njit  # numba==0.59.1 - optional
+except ImportError:
+    njit = None
 
 EXTENSION = 'png'
 FPS = 24
 width = 800
 height = 800
+CARD_SIZE = 80
+SCALE = 40
+ROTATE_SPEED = 0.02
+# mutation card -> the die attribute it toggles
+MUTATIONS = {
+    'eyes_mutation': 'eyes',
+    'stripes_mutation': 'stripes',
+    'colors_mutation': 'colors',
+}
+
+# wireframe shown in the hovered-card zoom, spun in 3D
+cube_points = [
+    (-1, -1, -1), (1, -1, -1), (1, 1, -1), (-1, 1, -1),
+    (-1, -1, 1), (1, -1, 1), (1, 1, 1), (-1, 1, 1),
+]
+bonds = [
+    (0, 1), (1, 2), (2, 3), (3, 0),
+    (4, 5), (5, 6), (6, 7), (7, 4),
+    (0, 4), (1, 5), (2, 6), (3, 7),
+]
+
+# circle-layout trig, computed once per card count and reused across shows
+_angle_cache: dict[int, tuple[np.ndarray, np.ndarray, np.ndarray]] = {}
+
+
+def circle_angles(count: int) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    if count not in _angle_cache:
+        angles = np.linspace(0, math.tau, count, endpoint=False)
+        _angle_cache[count] = (np.cos(angles), np.sin(angles), -np.degrees(angles) - 90)
+    return _angle_cache[count]
+
+
+def project(points: np.ndarray, rot: np.ndarray, scale: float, offset: float) -> np.ndarray:
+    return (points @ rot.T)[:, :2] * scale + offset
+
+
+# integer card encoding for the headless simulation; the 8 menavka cards
+# are (colors - 1) * 4 + (stripes - 1) * 2 + (eyes - 1), specials follow
+VENTILATION_ID = 8
+EYES_MUTATION_ID = 9
+STRIPES_MUTATION_ID = 10
+COLORS_MUTATION_ID = 11
+CARD_IDS = {
+    'red_stripe_1': 0, 'red_stripe_2': 1, 'red_dot_1': 2, 'red_dot_2': 3,
+    'blue_stripe_1': 4, 'blue_stripe_2': 5, 'blue_dot_1': 6, 'blue_dot_2': 7,
+    'ventilation': VENTILATION_ID,
+    'eyes_mutation': EYES_MUTATION_ID,
+    'stripes_mutation': STRIPES_MUTATION_ID,
+    'colors_mutation': COLORS_MUTATION_ID,
+    'blue_lab': 12, 'red_lab': 13, 'yellow_lab': 14,
+}
+
+
+def simulate(cards_disp: np.ndarray, pos: int, step: int, eyes: int, stripes: int, colors: int) -> int:
+    """Game.run without pygame: walk the integer-encoded ring to the end.
+
+    Takes the display ring from Field.as_ids() plus the cursor and dice
+    state; returns the ring index of the matched card, or -1 when the
+    mněňavka dies on the fourth mutation. Pure integer work, so Monte-Carlo
+    analysis over many shuffles stays cheap (and compiles under numba).
+    """
+    n = cards_disp.shape[0]
+    count = 0
+    wanted = (colors - 1) * 4 + (stripes - 1) * 2 + (eyes - 1)
+    while True:
+        pos = (pos + step) % n
+        card = cards_disp[pos]
+        if card == VENTILATION_ID:
+            # skip_to: jump to the next ventilation in walking order
+            best = n
+            for i in range(n):
+                if cards_disp[i] == VENTILATION_ID:
+                    delta = ((i - pos) * step) % n
+                    if 0 < delta < best:
+                        best = delta
+            pos = (pos + step * best) % n
+            continue
+        if EYES_MUTATION_ID <= card <= COLORS_MUTATION_ID:
+            if card == EYES_MUTATION_ID:
+                eyes ^= 3
+            elif card == STRIPES_MUTATION_ID:
+                stripes ^= 3
+            else:
+                colors ^= 3
+            wanted = (colors - 1) * 4 + (stripes - 1) * 2 + (eyes - 1)
+            if count == 3:
+                return -1
+            count += 1
+            continue
+        if card == wanted:
+            return pos
+
+
+if njit is not None:
+    simulate = njit(cache=True)(simulate)
+
+    # for the small point sets here even the numpy dispatch overhead shows up;
+    # compiled, the rotate+project+scale runs as one tight native loop.
+    # Spelled with explicit loops because numba lowers `@` through scipy's
+    # BLAS bindings, which may be missing even when numba itself imports
+    @njit(cache=True, fastmath=True)
+    def project(points: np.ndarray, rot: np.ndarray, scale: float, offset: float) -> np.ndarray:  # pylint: disable=function-redefined
+        out = np.empty((points.shape[0], 2), dtype=points.dtype)
+        for i in range(points.shape[0]):
+            x, y, z = points[i, 0], points[i, 1], points[i, 2]
+            out[i, 0] = (rot[0, 0] * x + rot[0, 1] * y + rot[0, 2] * z) * scale + offset
+            out[i, 1] = (rot[1, 0] * x + rot[1, 1] * y + rot[1, 2] * z) * scale + offset
+        return out
 
 
 class Config:
@@ -22,6 +136,11 @@ class Config:
     """
     # pylint: disable=too-few-public-methods
     # pylint: disable=use-dict-literal
+    __slots__ = (
+        'cards', 'deck_template', 'labs_dice', 'eyes_dice', 'stripes_dice', 'colors_dice',
+        'eyes_map', 'stripes_map', 'colors_map',
+    )
+
     def __init__(self) -> None:
         # card counts
         self.cards = dict(
@@ -43,6 +162,10 @@ class Config:
             yellow_lab=1,
             # shower=0,  # TODO need to decide if the shower counts as mutation - and if not, if it resets mutation count
         )
+        # expanded once; every Field just copies it instead of re-expanding
+        self.deck_template = tuple(itertools.chain.from_iterable(
+            [card] * count for card, count in self.cards.items()
+        ))
 
         # die
         self.labs_dice = (
@@ -63,19 +186,66 @@ class Config:
 
 
 class UserInterface:
+    # fixed attribute set: slot descriptors beat per-instance dict lookups
+    __slots__ = (
+        'width', 'height', 'background', 'img', 'transparent_layer', 'dirty',
+        '_tint_cache', '_darken_cache', '_ring_radius', '_ring_count', 'obj_map',
+        'cube_points_arr', 'bonds_arr', 'rot', 'rot_dy', '_zoom_frames',
+        '_zoom_surf', '_zoom_steps', '_zoom_cache', '_zoom_prev_rect', '_dot_surf',
+        'arrow_surfaces',
+    )
+
     def __init__(self):
         border = 2
         self.width = width
         self.height = height
         self.background = (214, 188, 155)  # (255, 255, 255)
-        self.img = pygame.display.set_mode((width + (2 * border), height + (2 * border)))
+        # vsync off: sparse updates gain nothing from syncing, only latency
+        self.img = pygame.display.set_mode((width + (2 * border), height + (2 * border)), vsync=0)
         self.img.fill(self.background)
         self.transparent_layer = None
-
-    def arrange_images_in_circle(self, imagesToArrange: list) -> Generator[tuple[pygame.Rect, pygame.Surface], None, None]:
+        self.dirty = []
+        self._tint_cache = {}
+        self._darken_cache = {}
+        self._ring_radius = 0.0
+        self._ring_count = 0
+        # stacked once so the per-frame projection is a single matmul;
+        # float32 keeps the geometry compact and SIMD-lane friendly
+        self.cube_points_arr = np.ascontiguousarray(cube_points, dtype=np.float32)
+        self.bonds_arr = np.asarray(bonds, dtype=np.int32)
+        # incremental rotation about y: one constant delta-matrix per frame
+        self.rot = np.eye(3, dtype=np.float32)
+        delta = -ROTATE_SPEED
+        cd, sd = math.cos(delta), math.sin(delta)
+        self.rot_dy = np.array([[cd, 0, sd], [0, 1, 0], [-sd, 0, cd]], dtype=np.float32)
+        self._zoom_frames = 0
+        # one persistent zoom canvas; the hovered rect is always CARD_SIZE square
+        self._zoom_surf = pygame.Surface((CARD_SIZE * 2, CARD_SIZE * 2)).convert()
+        self._zoom_steps = round(math.tau / ROTATE_SPEED)
+        self._zoom_cache = {}
+        self._zoom_prev_rect = None
+        # all wireframe vertices are the same dot - rasterize it once and stamp
+        dot = pygame.Surface((11, 11), pygame.SRCALPHA)
+        pygame.draw.circle(dot, (255, 255, 255), (5, 5), 5)
+        self._dot_surf = dot.convert_alpha()
+        # both throw arrows rasterized once; show_throw only blits
+        self.arrow_surfaces = {
+            'white': self._make_arrow((255, 255, 255), mirrored=False),
+            'black': self._make_arrow((0, 0, 0), mirrored=True),
+        }
+        # warm the surface cache while the display is already up, so no card
+        # pays disk I/O or format conversion mid-game; decoding runs in a
+        # thread pool since libpng releases the GIL
+        fnames = [fname for fname in os.listdir('menavky') if fname.endswith(EXTENSION)]
+        with ThreadPoolExecutor() as pool:
+            list(pool.map(self.image_load, fnames))
+
+    def arrange_images_in_circle(self, filenames: list) -> list[tuple[pygame.Rect, pygame.Surface]]:
         # pylint: disable=invalid-name
         imgWidth = self.width
         imgHeight = self.height
+        count = len(filenames)
+        images = [self.image_load(f'{filename}.{EXTENSION}') for filename in filenames]
 
         # we want the circle to be as large as possible.
         # but the circle shouldn't extend all the way to the edge of the image.
@@ -83,185 +253,355 @@ class UserInterface:
         # those images will partially fall over the edge.
         # so we reduce the diameter of the circle by the width/height of the widest/tallest image.
         diameter = min(
-            imgWidth  - max(img.size[0] for img in imagesToArrange),
-            imgHeight - max(img.size[1] for img in imagesToArrange)
+            imgWidth  - max(img.get_width() for img in images),
+            imgHeight - max(img.get_height() for img in images)
         )
         radius = diameter / 2
+        self._ring_radius = radius
+        self._ring_count = count
 
         circleCenterX = imgWidth // 2
         circleCenterY = imgHeight // 2
-        theta = 2 * math.pi / len(imagesToArrange)
-
-        for i, curImg in enumerate(imagesToArrange):
-            angle = i * theta
-            dx = int(radius * math.cos(angle))
-            dy = int(radius * math.sin(angle))
-
-            # dx and dy give the coordinates of where the center of our images would go.
-            # So we must subtract half the height/width of the image
-            # to find where their top-left corners should be.
-            # size = curImg.get_size()
-            size = curImg.size
-            pos = (
-                circleCenterX + dx - size[0] // 2,
-                circleCenterY + dy - size[1] // 2
-            )
-            rot = curImg.rotate(-angle / math.pi * 180 - 90, expand=True)
-
-            new_image = pygame.image.fromstring(rot.tobytes(), rot.size, rot.mode)
+        cos_t, sin_t, _ = circle_angles(count)
+
+        # all top-left corners in two vectorized passes: the ring offset
+        # (where the image centers go) minus half of each image's size
+        sizes = np.array([img.get_size() for img in images])
+        xs = (circleCenterX + (radius * cos_t).astype(int) - sizes[:, 0] // 2).tolist()
+        ys = (circleCenterY + (radius * sin_t).astype(int) - sizes[:, 1] // 2).tolist()
+
+        obj_map = []
+        blit_list = []
+        for i, filename in enumerate(filenames):
+            new_image = self._render_card(f'{filename}.{EXTENSION}', i, count)
             rect = new_image.get_rect()
-            rect.update(*pos, 80, 80)  # TODO 80 as global var
-            # drawing the rotated rectangle to the screen
-            self.blit(new_image, pos)
-            yield rect, new_image
+            rect.update(xs[i], ys[i], CARD_SIZE, CARD_SIZE)
+            blit_list.append((new_image, (xs[i], ys[i])))
+            obj_map.append((rect, new_image))
+        # one batched call amortizes the per-blit Python dispatch over all cards;
+        # fblits (pygame-ce >= 2.1.4) skips the special-flags plumbing entirely
+        if hasattr(self.img, 'fblits'):
+            self.img.fblits(blit_list)
+        else:
+            self.img.blits(blit_list, doreturn=0)
+        return obj_map
 
     def show(self, cards, direction):
         cards_to_show = list(reversed(cards)) if direction == 'black' else cards
-        images = [
-            Image
-            .open(f'menavky/{filename}.{EXTENSION}')
-            .convert('RGBA') for filename in cards_to_show
-        ]  # .resize((80, 80))
-        self.obj_map = list(zip(list(self.arrange_images_in_circle(images)), cards_to_show))
+        # arrange returns a list already - zip it straight into a tuple
+        self.obj_map = tuple(zip(self.arrange_images_in_circle(cards_to_show), cards_to_show))
+        self.dirty.append(self.img.get_rect())  # full redraw after a re-show
         self.update_transparent_layer()
 
+    def card_at(self, pos: tuple):
+        # the ring geometry is known, so the slot index falls out of the
+        # click angle directly - no rect scan over obj_map
+        dx = pos[0] - self.width // 2
+        dy = pos[1] - self.height // 2
+        if abs(math.hypot(dx, dy) - self._ring_radius) > CARD_SIZE:
+            return None
+        i = round(math.atan2(dy, dx) * self._ring_count / math.tau) % self._ring_count
+        (rect, img), fname = self.obj_map[i]
+        if not rect.collidepoint(pos):
+            return None
+        return i, rect, img, fname
+
+    def zoom_hovered(self, rectangle: pygame.Rect) -> None:
+        # the spin repeats after a full revolution, so frames are cached by
+        # phase; once the first revolution is drawn, hovering is blit-only
+        phase = self._zoom_frames % self._zoom_steps
+        self._zoom_frames += 1
+        cached = self._zoom_cache.get(phase)
+        if cached is not None:
+            self._place_zoom(cached, rectangle)
+            return
+        # no renormalization needed: the phase cache freezes rot after
+        # ~314 incremental products, far too few for float32 drift to show
+        self.rot = self.rot_dy @ self.rot
+        # one matmul projects every point at once instead of per-point np.matmul
+        points = project(self.cube_points_arr, self.rot, SCALE, CARD_SIZE)
+        surf = self._zoom_surf
+        surf.fill((0, 0, 0))
+        white = (255, 255, 255)
+        # one float->int pass up front; the draw calls then take plain int pairs
+        pts = points.astype(int)
+        # stamp the pre-rendered dot on every vertex in one batched call
+        dot = self._dot_surf
+        stamps = [(dot, off) for off in (pts - 5).tolist()]
+        if hasattr(surf, 'fblits'):
+            surf.fblits(stamps)
+        else:
+            surf.blits(stamps, doreturn=0)
+        # hold the lock across the line batch instead of letting every
+        # draw call lock/unlock the surface on its own
+        surf.lock()
+        # one fancy-indexed gather yields all (start, end) endpoint pairs
+        for start, end in pts[self.bonds_arr].tolist():
+            pygame.draw.line(surf, white, start, end)
+        surf.unlock()
+        self._zoom_cache[phase] = surf.copy()
+        self._place_zoom(surf, rectangle)
+
+    def _place_zoom(self, surf: pygame.Surface, rectangle: pygame.Rect) -> None:
+        # restore only what the previous zoom covered - a full reset_img
+        # would wipe the click tints and dirty the whole screen per frame.
+        # Same-spot frames skip the restore: the opaque zoom overwrites it
+        prev = self._zoom_prev_rect
+        if prev is not None and prev.topleft != rectangle.topleft:
+            self.clear_zoom()
+        self._zoom_prev_rect = self.blit(surf, rectangle)
+
+    def clear_zoom(self) -> None:
+        prev = self._zoom_prev_rect
+        if prev is not None:
+            self.img.blit(self.transparent_layer, prev, prev)
+            self.dirty.append(prev)
+            self._zoom_prev_rect = None
+
     def blit(self, surface, pos):
-        self.img.blit(surface, pos)
+        rect = self.img.blit(surface, pos)
+        self.dirty.append(rect)
+        return rect
 
     def update_transparent_layer(self):
-        self.transparent_layer = self.img.copy()
+        # opaque display-format copy, so reset_img hits SDL's fast 32-bit blitter
+        self.transparent_layer = self.img.copy().convert()
 
     def reset_img(self):
         self.blit(self.transparent_layer, (0, 0))
+        self._zoom_prev_rect = None  # the full restore covered it
+
+    def update_color(self, rectangle, img, key):
+        tinted = self._tint_cache.get(key)
+        if tinted is None:
+            # halve the red channel in SDL's multiply-blend path - no pixel
+            # view, no numpy pass; rotated sprites differ in size, so the
+            # overlays are cached per size. Only once per ring slot anyway -
+            # repeat clicks just re-blit
+            size = img.get_size()
+            overlay = self._darken_cache.get(size)
+            if overlay is None:
+                overlay = pygame.Surface(size, pygame.SRCALPHA)
+                overlay.fill((127, 255, 255, 255))
+                self._darken_cache[size] = overlay
+            tinted = img.copy()
+            tinted.blit(overlay, (0, 0), special_flags=pygame.BLEND_RGBA_MULT)
+            self._tint_cache[key] = tinted
+        # bake into the restore source too, so partial restores (hover
+        # clears, animation steps) keep the tint on the board
+        self.transparent_layer.blit(tinted, rectangle)
+        self.blit(tinted, rectangle)
 
-    def update_color(self, rectangle, img):
-        # pylint: disable=invalid-name
-        w, h = img.get_size()
-        for x, y in itertools.product(range(w), range(h)):
-            r, g, b, a = img.get_at((x, y))
-            img.set_at((x, y), pygame.Color(r // 2, g, b, a))
-        self.blit(img, rectangle)
+    @staticmethod
+    def _make_arrow(color: tuple, mirrored: bool) -> pygame.Surface:
+        scale = .2
+        # Big curly arrow instead?
+        # Generate arrow on the fly or have png?
+        points = ((0, 100), (0, 200), (250, 200), (250, 300), (350, 150), (250, 0), (250, 100))
+        surf = pygame.Surface((int(scale * 350), int(scale * 300)), pygame.SRCALPHA)
+        pygame.draw.polygon(surf, color, [
+            (scale * (350 - x if mirrored else x), scale * y) for x, y in points
+        ])
+        return surf
 
     @staticmethod
     @lru_cache()
     def image_load(fname):
-        return pygame.image.load(f'menavky/{fname}')
+        # converted once at load; matching pixel formats keep blits on SDL's fast path
+        surf = pygame.image.load(f'menavky/{fname}').convert_alpha()
+        if int(pygame.surfarray.array_alpha(surf).min()) == 255:
+            # fully opaque card - skip the per-pixel alpha blend entirely
+            return surf.convert()
+        return surf
+
+    @staticmethod
+    @lru_cache(maxsize=256)
+    def _render_card(fname: str, i: int, count: int) -> pygame.Surface:
+        # rotate in-engine - no PIL decode, no tobytes/fromstring copies;
+        # cached so repeated show() calls reduce to pure blits
+        deg = float(circle_angles(count)[2][i])
+        img = UserInterface.image_load(fname)
+        quarter = round(deg / 90)
+        if math.isclose(deg, quarter * 90):
+            # axis-aligned slots reduce to a pixel transpose, no resampling
+            return pygame.transform.rotate(img, quarter * 90)
+        return pygame.transform.rotozoom(img, deg, 1)
 
 
 class Field:
+    __slots__ = (
+        'animation', 'cards_static', 'cards_disp', 'direction', 'ui', '_rng',
+        'pos', 'step', '_n', '_unit', '_positions', 'next_step_at',
+        '_step_rects', 'current_card_filename',
+    )
+
     def __init__(self, config: Config, ui: UserInterface, animation: bool = True) -> None:
         self.animation = animation
-        self.cards_static = [card for card, count in config.cards.items() for _ in range(count)]
-        self.cards = None
+        self.cards_static = list(config.deck_template)
+        self.cards_disp = None
         self.direction = ''
         self.ui = ui
-        self.next_count = 0
+        self._rng = np.random.default_rng()
+        self.pos = 0
+        self.step = 1
+        self._n = len(self.cards_static)
+        self._unit = None
+        self._positions = None
+        self.next_step_at = 0
+        self._step_rects = []
         self.current_card_filename = ''
 
     def __len__(self):
         return len(self.cards_static)
 
     def __next__(self, visible: bool = True):
+        # advance the cursor one ring position in the current direction
+        self.pos = (self.pos + self.step) % self._n
+        card = self.cards_disp[self.pos]
         if not visible:
-            if self.direction == 'black':
-                self.next_count -= 1
-            else:
-                self.next_count += 1
-            return next(self.cards)
-        w = self.ui.width
-        h = self.ui.height
-        angle = 2 * math.pi / len(self) * (self.next_count - (
-            1 if self.direction == 'black' else 0
-        ))
-        shape = [(w // 2, h // 2), (w // 2 + 400 * math.cos(angle),
-                                    h // 2 + 400 * math.sin(angle))]
+            return card
+        ui = self.ui  # hoisted: the block below hits these attributes repeatedly
+        w2 = ui.width // 2
+        h2 = ui.height // 2
+        unit_x, unit_y = self._unit[self.pos]
+        shape = [(w2, h2), (w2 + 400 * unit_x, h2 + 400 * unit_y)]
 
         if self.animation:
-            self.ui.reset_img()
-            center_image = self.ui.image_load(self.current_card_filename)
-            self.ui.blit(center_image, ((w // 2) - 40, (h // 2) - 40))
-
-            pygame.draw.line(self.ui.img, (0, 0, 0), *shape)  # TODO dependency injection?
-            pygame.display.flip()
-            sleep(.55)  # pygame.time.wait?
-        if self.direction == 'black':
-            self.next_count -= 1
-        else:
-            self.next_count += 1
-        return next(self.cards)
+            # restore only the regions the previous step touched, not all 800x800
+            for rect in self._step_rects:
+                ui.img.blit(ui.transparent_layer, rect, rect)
+                ui.dirty.append(rect)
+            center_image = ui.image_load(self.current_card_filename)
+            center_rect = ui.blit(center_image, (w2 - 40, h2 - 40))
+
+            # queue on the back buffer; presentation happens once per frame
+            line_rect = pygame.draw.line(ui.img, (0, 0, 0), *shape)  # TODO dependency injection?
+            ui.dirty.append(line_rect)
+            self._step_rects = [center_rect, line_rect]
+            # no blocking sleep - callers pace themselves on this deadline
+            self.next_step_at = pygame.time.get_ticks() + 550
+        return card
 
     def next_invisible(self):
         return self.__next__(visible=False)  # pylint: disable=unnecessary-dunder-call
 
     def create(self, start: str, direction: str):
         self.direction = direction
-        self.cards_static.remove(start)
         self.shuffle()
-        self.cards_static.insert(0, start)
-        self.cards = itertools.cycle(self.cards_static)  # TODO or shuffle and then while loop on cycle?
+        # rotate the shuffled deck so an occurrence of start leads,
+        # instead of the O(n) remove + insert(0, ...) shifting
+        lead = self.cards_static.index(start)
+        self.cards_static = self.cards_static[lead:] + self.cards_static[:lead]
+        # cards_disp[i] is what show() puts at ring position i; traversal is
+        # just modular index arithmetic over it, no cycle iterator needed
+        self.cards_disp = list(reversed(self.cards_static)) if direction == 'black' else self.cards_static
+        self.step = -1 if direction == 'black' else 1
+        self.pos = (self.cards_disp.index(start) - self.step) % self._n
+        # unit vectors of every ring position - no trig in the step path
+        angles = np.linspace(0, math.tau, self._n, endpoint=False)
+        self._unit = np.stack([np.cos(angles), np.sin(angles)], 1)
+        # ring positions per label, for O(1) skips to the next occurrence
+        positions = {}
+        for i, card in enumerate(self.cards_disp):
+            positions.setdefault(card, []).append(i)
+        self._positions = {card: np.asarray(idxs) for card, idxs in positions.items()}
         self.ui.show(self.cards_static, direction)
         return self
 
     def shuffle(self):
-        random.shuffle(self.cards_static)  # mutates the list :(
+        # C-level Fisher-Yates, and no in-place mutation of the old list
+        order = self._rng.permutation(len(self.cards_static))
+        self.cards_static = [self.cards_static[i] for i in order]
+
+    def as_ids(self) -> np.ndarray:
+        # integer view of the display ring for the headless simulate()
+        return np.array([CARD_IDS[card] for card in self.cards_disp], dtype=np.int8)
+
+    def skip_to(self, label: str):
+        # jump straight to the next occurrence of label in walking order
+        # instead of stepping the cursor card by card
+        deltas = ((self._positions[label] - self.pos) * self.step) % self._n
+        self.pos = (self.pos + self.step * int(deltas[deltas > 0].min())) % self._n
 
     def cycle_to_start(self, start_lab: str, direction: str):
-        if self.direction != direction:
-            self.direction = direction
-            self.cards_static.reverse()
-            self.cards = itertools.cycle(self.cards_static)
-            self.next_count = 0
-        card = ''
-        while card != start_lab:
-            card = self.next_invisible()
+        self.direction = direction
+        self.step = -1 if direction == 'black' else 1
+        # O(1) seek: park the cursor on the start lab (labs are unique)
+        self.pos = self.cards_disp.index(start_lab)
 
     def show_throw(self, card: str, labs: tuple[str, str]):
-        self.ui.reset_img()
-        w = self.ui.width
-        h = self.ui.height
+        ui = self.ui
+        ui.reset_img()
+        w2 = ui.width // 2
+        h2 = ui.height // 2
         direction, lab = labs
 
-        center_image = self.ui.image_load(f'{card}.png')
-        self.ui.blit(center_image, ((w // 2) - 40, (h // 2) - 40 - 80))
-        center_image = self.ui.image_load(f'{lab}_lab.png')
-        self.ui.blit(center_image, ((w // 2) - 40, (h // 2) + 40))
+        center_image = ui.image_load(f'{card}.png')
+        ui.blit(center_image, (w2 - 40, h2 - 40 - 80))
+        center_image = ui.image_load(f'{lab}_lab.png')
+        ui.blit(center_image, (w2 - 40, h2 + 40))
 
-        h_offset = w // 2 - 30
-        v_offset = 100
-        scale = .2
-        # Big curly arrow instead?
-        # Generate arrow on the fly or have png?
-        if direction == 'white':
-            color = (255, 255, 255)
-            coordinates = (
-                (h_offset + scale *   0, v_offset + scale * 100),  # noqa: E222
-                (h_offset + scale *   0, v_offset + scale * 200),  # noqa: E222
-                (h_offset + scale * 250, v_offset + scale * 200),  # noqa: E222
-                (h_offset + scale * 250, v_offset + scale * 300),  # noqa: E222
-                (h_offset + scale * 350, v_offset + scale * 150),  # noqa: E222
-                (h_offset + scale * 250, v_offset + scale *   0),  # noqa: E222
-                (h_offset + scale * 250, v_offset + scale * 100),  # noqa: E222
-            )
-        elif direction == 'black':
-            color = (0, 0, 0)
-            coordinates = (
-                (h_offset + scale * (350 -   0), v_offset + scale * 100),  # noqa: E222
-                (h_offset + scale * (350 -   0), v_offset + scale * 200),  # noqa: E222
-                (h_offset + scale * (350 - 250), v_offset + scale * 200),  # noqa: E222
-                (h_offset + scale * (350 - 250), v_offset + scale * 300),  # noqa: E222
-                (h_offset + scale * (350 - 350), v_offset + scale * 150),  # noqa: E222
-                (h_offset + scale * (350 - 250), v_offset + scale *   0),  # noqa: E222
-                (h_offset + scale * (350 - 250), v_offset + scale * 100),  # noqa: E222
-            )
-        else:
+        if direction not in ui.arrow_surfaces:
             raise ValueError('Invalid direction provided')
-        pygame.draw.polygon(self.ui.img, color, coordinates)
+        # pre-rendered at UI init; no polygon rasterization per throw
+        ui.blit(ui.arrow_surfaces[direction], (w2 - 30, 100))
         pygame.display.flip()
 
 
+def _run_trials(n_trials: int, seed=None) -> np.ndarray:
+    config = Config()
+    deck = np.array([CARD_IDS[card] for card in config.deck_template], dtype=np.int8)
+    n = deck.shape[0]
+    rng = np.random.default_rng(seed)
+    results = np.empty(n_trials, np.int8)
+    for i in range(n_trials):
+        rng.shuffle(deck)
+        direction, lab = config.labs_dice[int(rng.integers(6))]
+        step = -1 if direction == 'black' else 1
+        # same cursor convention as Field.create: the first advance lands
+        # on the start lab, which matches nothing and walks on
+        pos = (int(np.nonzero(deck == CARD_IDS[f'{lab}_lab'])[0][0]) - step) % n
+        results[i] = simulate(
+            deck, pos, step,
+            config.eyes_dice[int(rng.integers(6))],
+            config.stripes_dice[int(rng.integers(6))],
+            config.colors_dice[int(rng.integers(6))],
+        )
+    return results
+
+
+def analyze(n_trials: int, jobs: int = 1) -> np.ndarray:
+    """Monte-Carlo over fresh shuffles and dice throws, no pygame needed.
+
+    Returns one simulate() outcome per trial: the ring index where the
+    game ended, or -1 when the mněňavka died. Trials are independent, so
+    jobs > 1 fans them out over processes with distinct RNG streams.
+    """
+    if jobs > 1:
+        seeds = np.random.SeedSequence().spawn(jobs)
+        share, extra = divmod(n_trials, jobs)
+        counts = [share + (i < extra) for i in range(jobs)]
+        with ProcessPoolExecutor(jobs) as pool:
+            return np.concatenate(list(pool.map(_run_trials, counts, seeds)))
+    return _run_trials(n_trials)
+
+
 class Game:
+    # the dice attributes land here from throw_dice, hence predeclared
+    __slots__ = (
+        'config', '_card_table', '_filename_table', 'field', 'field_len',
+        'labs', 'eyes', 'stripes', 'colors',
+        'init_labs', 'init_eyes', 'init_stripes', 'init_colors',
+    )
+
     def __init__(self, config: Config, field: Field) -> None:
         self.config = config
+        # only 8 dice combinations exist - format every card name up front
+        self._card_table = {
+            (colors, stripes, eyes): f'{config.colors_map[colors]}_{config.stripes_map[stripes]}_{eyes}'
+            for colors in (1, 2) for stripes in (1, 2) for eyes in (1, 2)
+        }
+        self._filename_table = {key: f'{name}.{EXTENSION}' for key, name in self._card_table.items()}
         self.throw_dice()
         self.field = field.create(f'{self.labs[1]}_lab', self.labs[0])  # TODO allow manual; and from photo
         self.field_len = len(self.field)
@@ -282,14 +622,13 @@ class Game:
         self.print_dice()
 
     def print_dice(self) -> None:
-        attrnames = {
-            'labs': lambda x: x,
-            'eyes': lambda x: self.config.eyes_map[x],
-            'stripes': lambda x: self.config.stripes_map[x],
-            'colors': lambda x: self.config.colors_map[x],
-        }
-        for attrname, _map in attrnames.items():
-            print(f'{attrname}: {_map(getattr(self, attrname))}')
+        config = self.config
+        print(
+            f'labs: {self.labs}\n'
+            f'eyes: {config.eyes_map[self.eyes]}\n'
+            f'stripes: {config.stripes_map[self.stripes]}\n'
+            f'colors: {config.colors_map[self.colors]}'
+        )
 
     def _throw_manual(self) -> None:
         for attrname in ('labs', 'eyes', 'stripes', 'colors'):
@@ -309,39 +648,40 @@ class Game:
                 setattr(self, attrname, val)
 
     def run(self) -> Generator[str, None, None]:
-        if not self.field.animation:
-            self.field.show_throw(
-                f'{self.config.colors_map[self.colors]}_{self.config.stripes_map[self.stripes]}_{self.eyes}',
-                self.labs,
-            )
+        field = self.field  # bound once - the loop below runs every game step
+        card_table = self._card_table
+        filename_table = self._filename_table
+        key = self.colors, self.stripes, self.eyes
+        card_to_find = card_table[key]
+        if not field.animation:
+            field.show_throw(card_to_find, self.labs)
         count = 0
         while True:
             # count = self.game_loop(count) - save 1 indentation level
-            card_to_find = f'{self.config.colors_map[self.colors]}_{self.config.stripes_map[self.stripes]}_{self.eyes}'
-            self.field.current_card_filename = f'{card_to_find}.{EXTENSION}'
+            field.current_card_filename = filename_table[key]
             # self.field is not-exhaustable generator
-            card = next(self.field)  # pylint: disable=stop-iteration-return
+            card = next(field)  # pylint: disable=stop-iteration-return
             if card == 'ventilation':
-                card = self.field.next_invisible()
-                while card != 'ventilation':
-                    card = self.field.next_invisible()
+                field.skip_to('ventilation')
+                # yield so the caller presents this step before the next
+                # one overwrites it in the back buffer
+                yield ''
                 continue
-            if card == 'eyes_mutation':
-                self.eyes = 2 if self.eyes == 1 else 1
-            elif card == 'stripes_mutation':
-                self.stripes = 2 if self.stripes == 1 else 1
-            elif card == 'colors_mutation':
-                self.colors = 2 if self.colors == 1 else 1
-            elif card == 'shower':
-                pass
-            if card.endswith('_mutation'):
+            die = MUTATIONS.get(card)
+            if die is not None:
+                setattr(self, die, getattr(self, die) ^ 3)  # branchless 1 <-> 2 toggle
+                # the dice only change here, so this is the one place the
+                # wanted card (and its filename key) needs refreshing
+                key = self.colors, self.stripes, self.eyes
+                card_to_find = card_table[key]
                 if count == 3:
                     # mněňavka dies
                     yield card
                 count += 1
+                yield ''  # present the mutation step too, see above
                 continue
-            # Construct the wanted card name
-            card_to_find = f'{self.config.colors_map[self.colors]}_{self.config.stripes_map[self.stripes]}_{self.eyes}'
+            if card == 'shower':
+                pass
             if card == card_to_find:
                 yield card  # TODO there are more instances of each card
             yield ''  # TODO decouple the computation from visualisation
@@ -357,14 +697,26 @@ class Game:
         assert not self.field.animation
         self.field.animation = True
         cards = self.run()
-        while not next(cards):  # bump generator until it returns value
-            pass
+        ui = self.field.ui
+        while True:
+            # bump generator until it returns value; every yielded step is
+            # presented and paced, the winning one included - run_again's
+            # show_throw would wipe it before anyone saw it
+            card = next(cards)
+            pygame.display.update(ui.dirty)
+            ui.dirty.clear()
+            pygame.time.wait(max(0, self.field.next_step_at - pygame.time.get_ticks()))
+            if card:
+                break
         self.field.animation = False
 
 
 def main() -> None:
     pygame.init()
     pygame.display.set_caption("Mněňavky")
+    # filter SDL-side: only the events the loop handles ever get queued
+    pygame.event.set_blocked(None)
+    pygame.event.set_allowed([pygame.QUIT, pygame.MOUSEBUTTONDOWN, pygame.MOUSEMOTION])
 
     config = Config()
     ui = UserInterface()
@@ -375,28 +727,56 @@ def main() -> None:
 
     done = False
     clock = pygame.time.Clock()
+    hovered = None
+    # resolved once - the loop below touches these every frame
+    field = game.field
+    dirty = ui.dirty
+    event_wait = pygame.event.wait
+    event_get = pygame.event.get
+    get_ticks = pygame.time.get_ticks
+    display_update = pygame.display.update
+    frame_ms = 1000 // FPS
 
     # basicfont = pygame.font.SysFont(None, 32)
 
     while not done:
-        if not card:
+        if not card and get_ticks() >= field.next_step_at:
             card = next(cards)
-        for event in pygame.event.get():
+        # sleep in the event queue while idle; the timeout keeps the card
+        # stepping and the hover rotation ticking at FPS
+        first = event_wait(frame_ms)
+        events = event_get()
+        if first.type != pygame.NOEVENT:
+            events.insert(0, first)
+        for event in events:
             if event.type == pygame.QUIT:
                 done = True
 
-            if event.type == pygame.MOUSEBUTTONDOWN and event.button == 1:
-                for (button_rect, img), fname in ui.obj_map:
-                    if button_rect.collidepoint(event.pos):
-                        game.field.ui.update_color(button_rect, img)
-                        if fname == card:
-                            print('Correct!')
-                            if not animation:
-                                game.replay_correct()
-                            cards = game.run_again()
-                            card = None
+            if event.type == pygame.MOUSEMOTION:
+                # only retarget here; the per-frame block below does the drawing
+                hit = ui.card_at(event.pos)
+                hovered = hit[1] if hit is not None else None
+                if hovered is None:
+                    ui.clear_zoom()
 
-        pygame.display.flip()
+            if event.type == pygame.MOUSEBUTTONDOWN and event.button == 1:
+                hit = ui.card_at(event.pos)
+                if hit is not None:
+                    i, button_rect, img, fname = hit
+                    ui.update_color(button_rect, img, (fname, i))
+                    if fname == card:
+                        print('Correct!')
+                        if not animation:
+                            game.replay_correct()
+                        cards = game.run_again()
+                        card = None
+
+        if hovered is not None:
+            ui.zoom_hovered(hovered)
+        if dirty:
+            # present only the regions that actually changed
+            display_update(dirty)
+            dirty.clear()
         clock.tick(FPS)
 
     # while input('Run again with the same field? (Or type q to quit) ') != 'q':